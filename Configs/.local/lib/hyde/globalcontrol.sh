@@ -37,12 +37,45 @@ get_hashmap() {
     unset skipStrays
     unset verboseMap
 
+    # hashes are cached per path as "mtime:size|hash|path", only new or modified images are rehashed
+    local hashCache="${HYDE_CACHE_HOME}/wallhash.${hashMech}"
+    local -A cacheStamp cacheHash missStamp
+    local cacheDirty=0 stamp hash image missList
+    if [ -f "${hashCache}" ]; then
+        while IFS='|' read -r stamp hash image; do
+            [ -z "${image}" ] && continue
+            cacheStamp["${image}"]="${stamp}"
+            cacheHash["${image}"]="${hash}"
+        done <"${hashCache}"
+    fi
+
     for wallSource in "$@"; do
         [ -z "${wallSource}" ] && continue
         [ "${wallSource}" == "--skipstrays" ] && skipStrays=1 && continue
         [ "${wallSource}" == "--verbose" ] && verboseMap=1 && continue
 
-        hashMap=$(find "${wallSource}" -type f \( -iname "*.gif" -o -iname "*.jpg" -o -iname "*.jpeg" -o -iname "*.png" \) -exec "${hashMech}" {} + | sort -k2)
+        hashMap=""
+        missList=()
+        while IFS='|' read -r stamp image; do
+            if [ "${cacheStamp["${image}"]}" == "${stamp}" ]; then
+                hashMap+="${cacheHash["${image}"]} ${image}"$'\n'
+            else
+                missList+=("${image}")
+                missStamp["${image}"]="${stamp}"
+            fi
+        done < <(find "${wallSource}" -type f \( -iname "*.gif" -o -iname "*.jpg" -o -iname "*.jpeg" -o -iname "*.png" \) -printf '%T@:%s|%p\n')
+
+        if [ "${#missList[@]}" -gt 0 ]; then
+            # hash in parallel, one file per call keeps each output line a single atomic write
+            while read -r hash image; do
+                hashMap+="${hash} ${image}"$'\n'
+                cacheStamp["${image}"]="${missStamp["${image}"]}"
+                cacheHash["${image}"]="${hash}"
+            done < <(printf '%s\0' "${missList[@]}" | xargs -0 -n 1 -P "$(nproc)" "${hashMech}")
+            cacheDirty=1
+        fi
+
+        hashMap=$(sort -k2 <<<"${hashMap%$'\n'}")
         if [ -z "${hashMap}" ]; then
             echo "WARNING: No image found in \"${wallSource}\""
             continue
@@ -69,6 +102,14 @@ get_hashmap() {
             echo ":: \${wallHash[${indx}]}=\"${wallHash[indx]}\" :: \${wallList[${indx}]}=\"${wallList[indx]}\""
         done
     fi
+
+    # persist new hashes and drop images that no longer exist
+    if [ "${cacheDirty}" -eq 1 ] && [ -d "${HYDE_CACHE_HOME}" ]; then
+        for image in "${!cacheHash[@]}"; do
+            [ -e "${image}" ] || continue
+            echo "${cacheStamp["${image}"]}|${cacheHash["${image}"]}|${image}"
+        done >"${hashCache}.$$" && mv "${hashCache}.$$" "${hashCache}" || rm -f "${hashCache}.$$"
+    fi
 }
 
 # shellcheck disable=SC2120
@@ -137,8 +178,7 @@ export HYDE_THEME \
 #// hypr vars
 
 if [ -n "$HYPRLAND_INSTANCE_SIGNATURE" ]; then
-    hypr_border="$(hyprctl -j getoption decoration:rounding | jq '.int')"
-    hypr_width="$(hyprctl -j getoption general:border_size | jq '.int')"
+    read -r hypr_border hypr_width < <(hyprctl --batch -j "getoption decoration:rounding;getoption general:border_size" | jq -rs '"\(.[0].int // 0) \(.[1].int // 0)"')
 
     export hypr_border=${hypr_border:-0}
     export hypr_width=${hypr_width:-0}
@@ -171,9 +211,8 @@ get_aurhlpr() {
 set_conf() {
     local varName="${1}"
     local varData="${2}"
-    touch "${XDG_STATE_HOME}/hyde/staterc"
 
-    if [ "$(grep -c "^${varName}=" "${XDG_STATE_HOME}/hyde/staterc")" -eq 1 ]; then
+    if grep -q "^${varName}=" "${XDG_STATE_HOME}/hyde/staterc" 2>/dev/null; then
         sed -i "/^${varName}=/c${varName}=\"${varData}\"" "${XDG_STATE_HOME}/hyde/staterc"
     else
         echo "${varName}=\"${varData}\"" >>"${XDG_STATE_HOME}/hyde/staterc"
@@ -260,7 +299,7 @@ get_hyprConf() {
     local hyVar="${1}"
     local file="${2:-"$HYDE_THEME_DIR/hypr.theme"}"
     local gsVal
-    gsVal="$(grep "^[[:space:]]*\$${hyVar}\s*=" "${file}" | cut -d '=' -f2 | sed 's/^[[:space:]]*//;s/[[:space:]]*$//')"
+    gsVal="$(awk -F '=' -v var="${hyVar}" '$1 ~ "^[[:space:]]*\\$" var "[[:space:]]*$" {gsub(/^[[:space:]]+|[[:space:]]+$/, "", $2); print $2}' "${file}")"
     [ -n "${gsVal}" ] && [[ "${gsVal}" != \$* ]] && echo "${gsVal}" && return 0
     declare -A gsMap=(
         [GTK_THEME]="gtk-theme"
@@ -3,14 +3,78 @@ import subprocess
 import json
 import argparse
 import os
+import socket
+import sys
 from collections import defaultdict
 import time
 
 
 # filepath: /home/khing/.local/lib/hyde/keybinds.hint.py
 
+DISPATCHER_MAP = {
+    "exec": "execute",
+    # Add more mappings as needed
+}
+
+CODE_MAP = {
+    61: "slash",
+    87: "KP_1",
+    88: "KP_2",
+    89: "KP_3",
+    83: "KP_4",
+    84: "KP_5",
+    85: "KP_6",
+    79: "KP_7",
+    80: "KP_8",
+    81: "KP_9",
+    90: "KP_0",
+}
+
+# keep in descending order, map_modDisplay subtracts the largest mask first
+MODKEY_MAP = {
+    64: "SUPER",
+    32: "HYPER",
+    16: "META",
+    8: "ALT",
+    4: "CTRL",
+    2: "CAPSLOCK",
+    1: "SHIFT",
+}
+
+KEY_MAP = {
+    "edge:r:d": "Touch right edge downwards",
+    "edge:r:l": "Touch right edge left",
+    "edge:r:r": "Touch right edge right",
+}
+
+
+def query_hyprland_socket(request):
+    """Send a request to the Hyprland IPC socket, None if it is unreachable."""
+    signature = os.getenv("HYPRLAND_INSTANCE_SIGNATURE")
+    runtime_dir = os.getenv("XDG_RUNTIME_DIR")
+    if not signature or not runtime_dir:
+        return None
+    socket_path = os.path.join(runtime_dir, "hypr", signature, ".socket.sock")
+    chunks = []
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(2)
+            sock.connect(socket_path)
+            sock.sendall(request.encode())
+            while chunk := sock.recv(65536):
+                chunks.append(chunk)
+    except OSError:
+        return None
+    return b"".join(chunks).decode()
+
 
 def get_hyprctl_binds():
+    reply = query_hyprland_socket("j/binds")
+    if reply is not None:
+        try:
+            return json.loads(reply)
+        except json.JSONDecodeError:
+            pass  # fall back to hyprctl below
     while True:
         try:
             result = subprocess.run(
@@ -52,44 +116,18 @@ def parse_description(description):
 
 
 def map_dispatcher(dispatcher):
-    dispatcher_map = {
-        "exec": "execute",
-        # Add more mappings as needed
-    }
-    return dispatcher_map.get(dispatcher, dispatcher)
+    return DISPATCHER_MAP.get(dispatcher, dispatcher)
 
 
 def map_codeDisplay(keycode, key):
     if keycode == 0:
         return key
-    code_map = {
-        61: "slash",
-        87: "KP_1",
-        88: "KP_2",
-        89: "KP_3",
-        83: "KP_4",
-        84: "KP_5",
-        85: "KP_6",
-        79: "KP_7",
-        80: "KP_8",
-        81: "KP_9",
-        90: "KP_0",
-    }
-    return code_map.get(keycode, key)
+    return CODE_MAP.get(keycode, key)
 
 
 def map_modDisplay(modmask):
-    modkey_map = {
-        64: "SUPER",
-        32: "HYPER",
-        16: "META",
-        8: "ALT",
-        4: "CTRL",
-        2: "CAPSLOCK",
-        1: "SHIFT",
-    }
     mod_display = []
-    for key, name in sorted(modkey_map.items(), reverse=True):
+    for key, name in MODKEY_MAP.items():
         if modmask >= key:
             modmask -= key
             mod_display.append(name)
@@ -98,12 +136,7 @@ def map_modDisplay(modmask):
 
 def map_keyDisplay(key):
     """Map key_display to a more descriptive term."""
-    key_map = {
-        "edge:r:d": "Touch right edge downwards",
-        "edge:r:l": "Touch right edge left",
-        "edge:r:r": "Touch right edge right",
-    }
-    return key_map.get(key, key)
+    return KEY_MAP.get(key, key)
 
 
 def find_duplicated_binds(binds):
@@ -276,29 +309,29 @@ def generate_rofi(binds):
             f"{displayed_rofi_keys} ::: {dispatcher} ::: {arg} ::: {repeated} ::: {meta_data}"
         )
 
-        def format_group(headers, level=0, parent_meta_data=""):
-            nonlocal rofi_str
-            if level == 0:
-                prefix = ""
-            elif level == 1:
-                prefix = ""
+    def format_group(headers, level=0, parent_meta_data=""):
+        nonlocal rofi_str
+        if level == 0:
+            prefix = ""
+        elif level == 1:
+            prefix = ""
+        else:
+            prefix = " " * (level - 1) + ""
+
+        suffix = f"[{parent_meta_data}]" if parent_meta_data else ""
+
+        for header, subgroups in headers.items():
+            current_meta_data = f"{header}{suffix}".strip(" <")
+            if header:
+                rofi_str += (
+                    f"{prefix} {header}  {suffix:>20} ::: ::: {current_meta_data}\n"
+                )
+            if isinstance(subgroups, dict):
+                format_group(subgroups, level + 1, current_meta_data)
             else:
-                prefix = " " * (level - 1) + ""
-
-            suffix = f"[{parent_meta_data}]" if parent_meta_data else ""
-
-            for header, subgroups in headers.items():
-                current_meta_data = f"{header}{suffix}".strip(" <")
-                if header:
-                    rofi_str += (
-                        f"{prefix} {header}  {suffix:>20} ::: ::: {current_meta_data}\n"
-                    )
-                if isinstance(subgroups, dict):
-                    format_group(subgroups, level + 1, current_meta_data)
-                else:
-                    for binding in subgroups:
-                        rofi_str += f"{binding} ::: ::: {current_meta_data}\n"
-                    rofi_str += f"━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━ ::: ::: {current_meta_data}\n"
+                for binding in subgroups:
+                    rofi_str += f"{binding} ::: ::: {current_meta_data}\n"
+                rofi_str += f"━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━ ::: ::: {current_meta_data}\n"
 
     format_group(groups)
     return rofi_str
@@ -382,7 +415,8 @@ if __name__ == "__main__":
             for (mod_display, key_display), binds in duplicated_binds.items():
                 print(f"unbind = {mod_display} , {key_display}")
         elif args.format == "json":
-            print(json.dumps(binds_data, indent=4))
+            json.dump(binds_data, sys.stdout, indent=4)
+            print()
         elif args.format == "md":
             print(generate_md(binds_data))
         elif args.format == "dmenu":
@@ -86,7 +86,7 @@ def parse_toml_to_env(toml_file, env_file=None, export=False):
             file.write("\n".join(output) + "\n")
         logging.debug("Environment variables have been written to %s", env_file) # Use % lazy formatting for better performance in logging
 
-    else:
+    elif logging.getLogger().isEnabledFor(logging.DEBUG):
         logging.debug("\n".join(output))
 
 
@@ -135,8 +135,7 @@ def main():
         watcher_thread.start()
         logging.debug("Watching %s for changes...", input_toml_file) # Same as line 77
         try:
-            while True:
-                time.sleep(1)
+            watcher_thread.join()
         except KeyboardInterrupt:
             logging.info("Daemon mode stopped.")
     else:
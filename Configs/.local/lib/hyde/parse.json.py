@@ -39,6 +39,8 @@ def fmt_logging():
 
 def remove_comments(json_data):
     """Remove single-line and multi-line comments from JSON data."""
+    if "//" not in json_data and "/*" not in json_data:
+        return json_data  # Nothing to strip, skip both regex passes
     json_data = re.sub(r"//.*", "", json_data)  # Remove single-line comments
     json_data = re.sub(
         r"/\*.*?\*/", "", json_data, flags=re.DOTALL
@@ -143,7 +145,7 @@ def main():
             sys.exit(1)
         if args.file == "-":
             print(result)
-        else:
+        elif result != json_data:
             with open(args.file, "w", encoding='UTF-8') as f:
                 f.write(result)
     elif args.query:
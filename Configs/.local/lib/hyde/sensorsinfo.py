@@ -3,6 +3,7 @@
 import json
 import subprocess
 import os
+import signal
 
 DEVICE_GLYPHS = {
     "iwlwifi": "",
@@ -54,47 +55,53 @@ def save_current_page(page):
     with open(PAGE_FILE, 'w') as f:
         f.write(str(page))
 
-def get_temp_color(temp):
-    temp_colors = {
-        120: "#8b0000",  # Dark Red for 120 and above
-        115: "#ad1f2f",  # Red for 115 to 119
-        110: "#d22f2f",  # Light Red for 110 to 114
-        105: "#ff471a",  # Orange-Red for 105 to 109
-        100: "#ff6347",  # Tomato for 100 to 104
-        95: "#ff8c00",   # Dark Orange for 95 to 99
-        90: "#ffa500",   # Orange for 90 to 94
-        85: "#ffd700",   # Gold for 85 to 89
-        80: "#ffff00",   # Yellow for 80 to 84
-        75: "#ffa07a",   # Light Salmon for 75 to 79
-        70: "#ff7f50",   # Coral for 70 to 74
-        65: "#ff4500",   # Orange Red for 65 to 69
-        60: "#ff6347",   # Tomato for 60 to 64
-        55: "#ff8c00",   # Dark Orange for 55 to 59
-        45: "",          # No color for 45 to 54
-        40: "#add8e6",   # Light Blue for 40 to 44
-        35: "#87ceeb",   # Sky Blue for 35 to 39
-        30: "#4682b4",   # Steel Blue for 30 to 34
-        25: "#4169e1",   # Royal Blue for 25 to 29
-        20: "#0000ff",   # Blue for 20 to 24
-        0: "#00008b"     # Dark Blue for below 20
-    }
+def signal_waybar(sig):
+    for pid in os.listdir("/proc"):
+        if not pid.isdigit():
+            continue
+        try:
+            with open(f"/proc/{pid}/comm") as f:
+                if f.read().strip() == "waybar":
+                    os.kill(int(pid), sig)
+        except OSError:
+            continue
+
+TEMP_COLORS = {
+    120: "#8b0000",  # Dark Red for 120 and above
+    115: "#ad1f2f",  # Red for 115 to 119
+    110: "#d22f2f",  # Light Red for 110 to 114
+    105: "#ff471a",  # Orange-Red for 105 to 109
+    100: "#ff6347",  # Tomato for 100 to 104
+    95: "#ff8c00",   # Dark Orange for 95 to 99
+    90: "#ffa500",   # Orange for 90 to 94
+    85: "#ffd700",   # Gold for 85 to 89
+    80: "#ffff00",   # Yellow for 80 to 84
+    75: "#ffa07a",   # Light Salmon for 75 to 79
+    70: "#ff7f50",   # Coral for 70 to 74
+    65: "#ff4500",   # Orange Red for 65 to 69
+    60: "#ff6347",   # Tomato for 60 to 64
+    55: "#ff8c00",   # Dark Orange for 55 to 59
+    45: "",          # No color for 45 to 54
+    40: "#add8e6",   # Light Blue for 40 to 44
+    35: "#87ceeb",   # Sky Blue for 35 to 39
+    30: "#4682b4",   # Steel Blue for 30 to 34
+    25: "#4169e1",   # Royal Blue for 25 to 29
+    20: "#0000ff",   # Blue for 20 to 24
+    0: "#00008b"     # Dark Blue for below 20
+}
+TEMP_THRESHOLDS = sorted(TEMP_COLORS, reverse=True)
 
-    for threshold in sorted(temp_colors.keys(), reverse=True):
+def get_temp_color(temp):
+    for threshold in TEMP_THRESHOLDS:
         if temp >= threshold:
-            color = temp_colors[threshold]
+            color = TEMP_COLORS[threshold]
             if color:
                 return f"<span color='{color}'><b>{temp}°C</b></span>"
             else:
                 return f"{temp}°C"
     return f"{temp}°C"
 
-def get_sensor_data(page=0):
-    try:
-        sensors_data = json.loads(result.stdout)
-    except json.JSONDecodeError:
-        print("Error: Failed to decode JSON from sensors output")
-        return {"text": " N/A", "tooltip": "Error: Failed to decode JSON from sensors output"}
-    
+def get_sensor_data(sensors_data, page=0):
     # Initialize variables
     device_data = {}
     
@@ -180,17 +187,21 @@ if __name__ == "__main__":
     result = subprocess.run(["sensors", "-j"], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
     # result = subprocess.run(['sensors', '-j'], capture_output=True, text=True)
     # result = subprocess.run(['cat', '/tmp/beef'], capture_output=True, text=True)
-    sensors_data = json.loads(result.stdout)
+    try:
+        sensors_data = json.loads(result.stdout)
+    except json.JSONDecodeError:
+        print(json.dumps({"text": " N/A", "tooltip": "Error: Failed to decode JSON from sensors output"}, separators=(',', ':')))
+        sys.exit(0)
     devices = list(sensors_data.keys())
     total_pages = (len(devices) + PAGE_SIZE - 1) // PAGE_SIZE
 
     page = get_current_page(total_pages)
     if '--next' in sys.argv:
         page = (page + 1) % total_pages
-        subprocess.run(['pkill', '-RTMIN+19', 'waybar'])
+        signal_waybar(signal.SIGRTMIN + 19)
     elif '--prev' in sys.argv:
         page = (page - 1 + total_pages) % total_pages
-        subprocess.run(['pkill', '-RTMIN+19', 'waybar'])
+        signal_waybar(signal.SIGRTMIN + 19)
     save_current_page(page)
-    sensor_info = get_sensor_data(page)
+    sensor_info = get_sensor_data(sensors_data, page)
     print(json.dumps(sensor_info, separators=(',', ':')))
\ No newline at end of file
@@ -9,6 +9,7 @@ source "${scrDir}/globalcontrol.sh"
 waybar_dir="${confDir}/waybar"
 modules_dir="$waybar_dir/modules"
 conf_file="$waybar_dir/config.jsonc"
+conf_tmp="$waybar_dir/config.jsonc.tmp"
 conf_ctl="$waybar_dir/config.ctl"
 export scrDir
 
@@ -20,7 +21,7 @@ switch=0
 
 if [ "${num_files}" -gt 1 ]; then
     for ((i = 0; i < "${num_files}"; i++)); do
-        flag=$(cut -d '|' -f 1 <<<"${read_ctl[i]}")
+        flag="${read_ctl[i]%%|*}"
         if [ "${flag}" -eq 1 ] && [ "$1" == "n" ]; then
             nextIndex=$(((i + 1) % "${num_files}"))
             switch=1
@@ -37,16 +38,24 @@ fi
 if [ $switch -eq 1 ]; then
     update_ctl="${read_ctl[nextIndex]}"
     reload_flag=1
-    sed -i "s/^1/0/g" "$conf_ctl"
-    awk -F '|' -v cmp="$update_ctl" '{OFS=FS} {if($0==cmp) $1=1; print$0}' "${conf_ctl}" >"${waybar_dir}/tmp" && mv "${waybar_dir}/tmp" "${conf_ctl}"
+    awk -F '|' -v cmp="$update_ctl" '{OFS=FS} {sub(/^1/, "0")} {if($0==cmp) $1=1; print$0}' "${conf_ctl}" >"${waybar_dir}/tmp" && mv "${waybar_dir}/tmp" "${conf_ctl}"
 fi
 
+# read the active layout once
+
+active_ctl="$(grep -m 1 '^1|' "${conf_ctl}")"
+
+# generate style alongside the config, it only depends on config.ctl
+
+"$scrDir/wbarstylegen.sh" &
+style_pid=$!
+
 # overwrite config from header module
 
 # shellcheck disable=SC2155
-export set_sysname=$(hostnamectl hostname)
+export set_sysname="${HOSTNAME:-$(hostnamectl hostname)}"
 # shellcheck disable=SC2155
-export w_position=$(grep '^1|' "${conf_ctl}" | cut -d '|' -f 3)
+export w_position=$(cut -d '|' -f 3 <<<"${active_ctl}")
 
 # setting explicit waybar output
 
@@ -75,7 +84,7 @@ right)
     ;;
 esac
 
-w_height=$(grep '^1|' "${conf_ctl}" | cut -d '|' -f 2)
+w_height=$(cut -d '|' -f 2 <<<"${active_ctl}")
 if [ -z "${w_height}" ]; then
     # y_monres=$(cat /sys/class/drm/*/modes | head -1 | cut -d 'x' -f 2)
     y_monres=$(hyprctl -j monitors | jq '.[] | select(.focused == true) | (.height / .scale)')
@@ -83,7 +92,9 @@ if [ -z "${w_height}" ]; then
 fi
 export w_height
 
-export i_size=$((w_height * 6 / 10))
+i_base=$((w_height * 6 / 10)) # icon size 60% of height
+
+export i_size=${i_base}
 if [ $i_size -lt 12 ]; then
     export i_size="12"
 fi
@@ -91,7 +102,7 @@ fi
 i_theme="$(get_hyprConf ICON_THEME)"
 export i_theme
 
-export i_task=$((w_height * 6 / 10))
+export i_task=${i_base}
 if [ $i_task -lt 16 ]; then
     export i_task="16"
 fi
@@ -100,66 +111,76 @@ if [ $i_priv -lt 12 ]; then
     export i_priv="12"
 fi
 
-envsubst <"${modules_dir}/header.jsonc" >"${conf_file}"
-
 # module generator function
 
+list_mods() {
+    local mod="$1"
+
+    mod="${mod//(/"custom/l_end"}"
+    mod="${mod//)/"custom/r_end"}"
+    mod="${mod//[/"custom/sl_end"}"
+    mod="${mod//]/"custom/sr_end"}"
+    mod="${mod//\{/"custom/rl_end"}"
+    mod="${mod//\}/"custom/rr_end"}"
+    mod="${mod// /"\",\""}"
+    echo -e "${mod}"
+}
+
 gen_mod() {
     local pos=$1
     local col=$2
-    local mod=""
+    local mod
+    mod="$(cut -d '|' -f "${col}" <<<"${active_ctl}")"
 
-    list_mods() {
-        mod="$(grep '^1|' "${conf_ctl}" | cut -d '|' -f "${col}")"
+    write_mod="$write_mod $(list_mods "${mod}")" # This is used to copy the modules to the config later
 
-        if [[ $1 == "clean" ]]; then
-            # Process each word and remove the part after '##' indicating a tag
-            mod=$(echo "$mod" | awk '{for(i=1;i<=NF;i++){sub(/##.*/,"",$i); printf "%s ", $i}}')
-            mod="${mod% }" # Remove trailing space
-        fi
+    # Process each word and remove the part after '##' indicating a tag
+    mod=$(echo "$mod" | awk '{for(i=1;i<=NF;i++){sub(/##.*/,"",$i); printf "%s ", $i}}')
+    mod="${mod% }" # Remove trailing space
 
-        mod="${mod//(/"custom/l_end"}"
-        mod="${mod//)/"custom/r_end"}"
-        mod="${mod//[/"custom/sl_end"}"
-        mod="${mod//]/"custom/sr_end"}"
-        mod="${mod//\{/"custom/rl_end"}"
-        mod="${mod//\}/"custom/rr_end"}"
-        mod="${mod// /"\",\""}"
-        echo -e "${mod}"
-    }
+    echo -e "\t\"modules-${pos}\": [\"custom/padd\",\"$(list_mods "${mod}")\",\"custom/padd\"],"
 
-    write_mod="$write_mod $(list_mods)" # This is used to copy the modules to the config later
+}
 
-    echo -e "\t\"modules-${pos}\": [\"custom/padd\",\"$(list_mods clean)\",\"custom/padd\"]," >>"${conf_file}"
+# write the config in a single pass
 
-}
+{
+    envsubst <"${modules_dir}/header.jsonc"
 
-# write positions for modules
+    # write positions for modules
 
-echo -e "\n\n// positions generated based on config.ctl //\n" >>"${conf_file}"
-gen_mod left 4
-gen_mod center 5
-gen_mod right 6
+    echo -e "\n\n// positions generated based on config.ctl //\n"
+    gen_mod left 4
+    gen_mod center 5
+    gen_mod right 6
 
-# copy modules/*.jsonc to the config
+    # copy modules/*.jsonc to the config
 
-echo -e "\n\n// sourced from modules based on config.ctl //\n" >>"${conf_file}"
-echo "$write_mod" | sed 's/","/\n/g ; s/ /\n/g' | awk -F '/' '{print $NF}' | awk -F '#' '{print}' | awk '!x[$0]++' | while read -r mod_cpy; do
-    if [ -f "${modules_dir}/${mod_cpy}.jsonc" ]; then
-        envsubst <"${modules_dir}/${mod_cpy}.jsonc" >>"${conf_file}"
-    fi
-done
+    echo -e "\n\n// sourced from modules based on config.ctl //\n"
+    echo "$write_mod" | sed 's/","/\n/g ; s/ /\n/g' | awk -F '/' '!x[$NF]++ {print $NF}' | while read -r mod_cpy; do
+        if [ -f "${modules_dir}/${mod_cpy}.jsonc" ]; then
+            envsubst <"${modules_dir}/${mod_cpy}.jsonc"
+        fi
+    done
+
+    cat "${modules_dir}/footer.jsonc"
+} >"${conf_tmp}"
 
-cat "${modules_dir}/footer.jsonc" >>"${conf_file}"
+# only replace the config when it changed
+
+if cmp -s "${conf_tmp}" "${conf_file}"; then
+    rm -f "${conf_tmp}"
+else
+    mv "${conf_tmp}" "${conf_file}"
+fi
 
-# generate style
+# wait for style generation
 
-"$scrDir/wbarstylegen.sh"
+wait "${style_pid}"
 
-# restart waybar
+# reload waybar in place, or start it if it is not running
 
-if [ "$reload_flag" == "1" ]; then
-    killall waybar
+if [ "$reload_flag" == "1" ] && ! pkill -SIGUSR2 -x waybar; then
     if [ -f "${waybar_dir}/config" ] && [ -s "${waybar_dir}/config" ]; then
         waybar &
         disown
@@ -11,14 +11,19 @@ modules_dir="$waybar_dir/modules"
 conf_ctl="$waybar_dir/config.ctl"
 in_file="$waybar_dir/modules/style.css"
 out_file="$waybar_dir/style.css"
+out_tmp="$waybar_dir/style.css.tmp"
 src_file="${confDir}/hypr/themes/theme.conf"
 
+# read the active layout once
+
+active_ctl="$(grep -m 1 '^1|' "$conf_ctl")"
+
 # calculate height from control file or monitor res
 
-b_height=${WAYBAR_SCALE:-$(grep '^1|' "$conf_ctl" | cut -d '|' -f 2)}
+b_height=${WAYBAR_SCALE:-$(cut -d '|' -f 2 <<<"$active_ctl")}
 
 if [ -z "$b_height" ] || [ "$b_height" == "0" ]; then
-    y_monres=$(cat /sys/class/drm/*/modes | head -1 | cut -d 'x' -f 2)
+    # y_monres=$(cat /sys/class/drm/*/modes | head -1 | cut -d 'x' -f 2)
     y_monres=$(hyprctl -j monitors | jq '.[] | select(.focused == true) | (.height / .scale)')
     b_height=$((y_monres * 3 / 100))
 fi
@@ -47,7 +52,7 @@ fi
 
 # adjust values for vert/horz
 
-w_position="$(grep '^1|' "$conf_ctl" | cut -d '|' -f 3)"
+w_position="$(cut -d '|' -f 3 <<<"$active_ctl")"
 export w_position
 case ${w_position} in
 top | bottom)
@@ -110,12 +115,20 @@ export font_name=${font_name:-"JetBrainsMono Nerd Font"}
 # list modules and generate theme style
 export modules_ls
 # modules_ls=$(grep -m 1 '".*.": {'  --exclude="$modules_dir/footer.jsonc" "${modules_dir}"/*.jsonc | cut -d '"' -f 2 | awk -F '/' '{ if($1=="custom") print "#custom-"$NF"," ; else print "#"$NF","}')
-modules_ls=$(grep -m 1 '".*.": {' --exclude="$modules_dir/footer.jsonc" "${modules_dir}"/*.jsonc | cut -d '"' -f 2 | awk -F '/' '{print ($1=="custom" ? "#custom-"$NF : "#"$NF)","}')
-envsubst <"$in_file" >"$out_file"
+modules_ls=$(awk -F '"' 'FILENAME ~ /\/footer\.jsonc$/ {nextfile} /".*.": \{/ {n = split($2, mod, "/"); print (mod[1] == "custom" ? "#custom-" : "#") mod[n] ","; nextfile}' "${modules_dir}"/*.jsonc)
 
-# override rounded corners
-hypr_border=$(awk -F '=' '{if($1~" rounding ") print $2}' "$src_file" | sed 's/ //g')
+# override rounded corners while rendering the style
+hypr_border=$(awk -F '=' '{if($1~" rounding ") {gsub(/ /, "", $2); print $2}}' "$src_file")
 hypr_border=${hypr_border:-$WAYBAR_BORDER_RADIUS}
 if [ "$hypr_border" == "0" ] || [ -z "$hypr_border" ]; then
-    sed -i "/border-radius: /c\    border-radius: 0px;" "$out_file"
+    envsubst <"$in_file" | sed "/border-radius: /c\    border-radius: 0px;" >"$out_tmp"
+else
+    envsubst <"$in_file" >"$out_tmp"
+fi
+
+# only replace the style when it changed
+if cmp -s "$out_tmp" "$out_file"; then
+    rm -f "$out_tmp"
+else
+    mv "$out_tmp" "$out_file"
 fi
@@ -1,7 +1,8 @@
 #!/usr/bin/env python
 
 import json
-import requests
+from urllib.parse import quote
+from urllib.request import urlopen
 from datetime import datetime
 import os
 
@@ -51,13 +52,22 @@ WEATHER_CODES = {
 
 ### Functions ###
 def load_env_file(filepath):
-    with open(filepath) as f:
-        for line in f:
-            if line.strip() and not line.startswith("#"):
-                if line.startswith("export "):
-                    line = line[len("export ") :]
-                key, value = line.strip().split("=", 1)
-                os.environ[key] = value.strip('"')
+    try:
+        with open(filepath) as f:
+            lines = f.read().splitlines()
+    except FileNotFoundError:
+        return
+    env = {}
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        if line.startswith("export "):
+            line = line[len("export ") :]
+        key, sep, value = line.partition("=")
+        if sep:
+            env[key] = value.strip("\"'")
+    os.environ.update(env)
 
 
 def get_weather_icon(weatherinstance):
@@ -164,8 +174,11 @@ def format_chances(hour):
 
 ### Variables ###
 # Load environment variables from the specified files
-load_env_file(os.path.expanduser("~/.local/state/hyde/staterc"))
-load_env_file(os.path.expanduser("~/.local/state/hyde/config"))
+hyde_state_home = os.path.join(
+    os.getenv("XDG_STATE_HOME") or os.path.expanduser("~/.local/state"), "hyde"
+)
+load_env_file(os.path.join(hyde_state_home, "staterc"))
+load_env_file(os.path.join(hyde_state_home, "config"))
 
 temp_unit = os.getenv(
     "WEATHER_TEMPERATURE_UNIT", "c"
@@ -220,7 +233,8 @@ if forecast_days not in range(4):
 ### Main Logic ###
 data = {}
 # Get the weather data
-weather = requests.get(f"https://wttr.in/{get_location}?format=j1", timeout=10).json()
+with urlopen(f"https://wttr.in/{quote(get_location)}?format=j1", timeout=10) as response:
+    weather = json.load(response)
 current_weather = weather["current_condition"][0]
 
 # Get the data to display
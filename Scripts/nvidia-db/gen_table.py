@@ -2,18 +2,21 @@
 import os
 import argparse
 
-def generate_table(directory):
+def list_tables(directory):
+    with os.scandir(directory) as entries:
+        return [entry.name for entry in entries if entry.is_file() and entry.name.startswith("nvidia-")]
+
+def generate_table(directory, filenames):
     table = []
-    for filename in os.listdir(directory):
-        if filename.startswith("nvidia-"):
-            with open(os.path.join(directory, filename), 'r') as file:
-                lines = file.readlines()
-                table.append(f"## {filename}\n")
-                table.append("| NVE0 | NVE4 | GK104 | Description |\n")
-                table.append("|------|------|-------|-------------|\n")
-                for line in lines:
-                    table.append(f"| {' | '.join(line.strip().split('|'))} |\n")
-                table.append("\n")
+    for filename in filenames:
+        with open(os.path.join(directory, filename), 'r') as file:
+            lines = file.readlines()
+            table.append(f"## {filename}\n")
+            table.append("| NVE0 | NVE4 | GK104 | Description |\n")
+            table.append("|------|------|-------|-------------|\n")
+            for line in lines:
+                table.append(f"| {' | '.join(line.strip().split('|'))} |\n")
+            table.append("\n")
     return table
 
 def write_table_to_file(table, output_file, start_marker, end_marker):
@@ -30,12 +33,11 @@ def write_table_to_file(table, output_file, start_marker, end_marker):
     with open(output_file, 'w') as file:
         file.writelines(new_content)
 
-def generate_table_of_contents(directory):
+def generate_table_of_contents(filenames):
     table_of_contents = []
     table_of_contents.append(f"# Table of Contents\n")
-    for filename in os.listdir(directory):
-        if filename.startswith("nvidia-"):
-            table_of_contents.append(f"- [{filename}](#{filename})\n")
+    for filename in filenames:
+        table_of_contents.append(f"- [{filename}](#{filename})\n")
     return table_of_contents
 
 if __name__ == "__main__":
@@ -45,9 +47,10 @@ if __name__ == "__main__":
 
     directory = "."
     output_file = args.file
+    filenames = list_tables(directory)
     
-    nvidia_table = generate_table(directory)
+    nvidia_table = generate_table(directory, filenames)
     write_table_to_file(nvidia_table, output_file, "<!-- START NVIDIA TABLE -->\n", "<!-- END NVIDIA TABLE -->\n")
     
-    table_of_contents = generate_table_of_contents(directory)
+    table_of_contents = generate_table_of_contents(filenames)
     write_table_to_file(table_of_contents, output_file, "<!-- START TABLE OF CONTENTS -->\n", "<!-- END TABLE OF CONTENTS -->\n")